@@ -6,6 +6,8 @@ Why:
 - Makes deployments easy (change env vars, not code).
 """
 
+from dataclasses import dataclass
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -17,8 +19,40 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    # DB connection pool (tune per deployment without code changes)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # seconds; drop connections older than this
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+
+    # Test-suite only: cheap password hashing (see src/core/security.py).
+    # Never enable in production.
+    PASSWORD_HASH_TEST_MODE: bool = False
+
     #tell pydantic to also load a local ".env" file if present (dev-friendly)
     model_config = SettingsConfigDict(env_file = ".env", env_file_encodings="utf-8")
 
+
+@dataclass(slots=True, frozen=True)
+class FrozenSettings:
+    """
+    Read-only snapshot of Settings, built once at import.
+
+    Why:
+    - Settings are read on hot paths (tokens, DB setup).
+    - Slot attributes are plain fixed-offset reads, no pydantic machinery.
+    - frozen=True: config can't be changed by accident at runtime.
+    """
+    DATABASE_URL: str
+    JWT_SECRET: str
+    JWT_ALGORITHM: str
+    ACCESS_TOKEN_EXPIRE_MINUTES: int
+    DB_POOL_SIZE: int
+    DB_MAX_OVERFLOW: int
+    DB_POOL_RECYCLE: int
+    DB_POOL_TIMEOUT: int
+    PASSWORD_HASH_TEST_MODE: bool
+
+
 #create a settings object to import anywhere
-settings = Settings()
\ No newline at end of file
+settings = FrozenSettings(**Settings().model_dump())
\ No newline at end of file
@@ -3,17 +3,22 @@ FastAPI dependencies for authentication.
 
 Why:
 - Dependencies are reusable pieces of logic.
-- Protected routes can just add `user: User = Depends(get_current_user)`.
+- Protected routes can just add `user: CurrentUser`.
+- Routes that serve cached data can use `user_id: TokenUserId` (token check only, no DB).
+- Routes that only need the caller's ID can use `user_id: CurrentUserId` (lighter query).
 - Keeps route code clean and DRY.
 """
 
+import uuid
+from typing import Annotated
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
 from src.core.tokens import decode_access_token
 from src.db.session import get_db
-from src.repositories.user_repo import get_user_by_id
+from src.repositories.user_repo import get_user_by_id, get_user_id
 from src.models.user import User
 
 
@@ -21,8 +26,30 @@ from src.models.user import User
 security = HTTPBearer()
 
 
-def get_current_user(
+def get_token_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> str:
+    """
+    Extract and verify the JWT token, returning the user_id inside it.
+
+    Why:
+    - No DB work: routes that serve cached data only need the token's subject.
+    - get_current_user / get_current_user_id build on top of this.
+
+    Raises:
+    - 401 if token is invalid or expired
+    """
+    user_id = decode_access_token(credentials.credentials)
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+        )
+    return user_id
+
+
+def get_current_user(
+    user_id: str = Depends(get_token_user_id),
     db: Session = Depends(get_db),
 ) -> User:
     """
@@ -30,7 +57,7 @@ def get_current_user(
     
     Flow:
     1. HTTPBearer extracts token from Authorization header
-    2. decode_access_token verifies JWT signature + expiry
+    2. decode_access_token verifies JWT signature + expiry (get_token_user_id)
     3. Load user from DB using user_id from token
     4. Return user object
     
@@ -42,22 +69,12 @@ def get_current_user(
     
     Usage in routes:
     ```python
-    @router.get("/me")
-    def get_profile(user: User = Depends(get_current_user)):
+    @router.patch("/me")
+    def update_profile_endpoint(user: CurrentUser):
         # user is already loaded and verified
         return {"email": user.email}
     ```
     """
-    token = credentials.credentials
-    
-    # Decode and verify token
-    user_id = decode_access_token(token)
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-        )
-    
     # Load user from DB
     user = get_user_by_id(db, user_id)
     if not user:
@@ -67,3 +84,34 @@ def get_current_user(
         )
     
     return user
+
+
+def get_current_user_id(
+    user_id: str = Depends(get_token_user_id),
+    db: Session = Depends(get_db),
+) -> uuid.UUID:
+    """
+    Same checks as get_current_user, but returns only the user's ID.
+
+    Why:
+    - Many protected endpoints only need to know *who* is calling.
+    - Selecting just the id column is cheaper than loading the full User row.
+
+    Raises:
+    - 401 if token is missing, invalid, expired, or user not found
+    """
+    found_id = get_user_id(db, user_id)
+    if not found_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+
+    return found_id
+
+
+# Annotated aliases: every route refers to the *same* dependency callable,
+# so FastAPI's per-request dependency cache resolves each one only once.
+TokenUserId = Annotated[str, Depends(get_token_user_id)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUserId = Annotated[uuid.UUID, Depends(get_current_user_id)]
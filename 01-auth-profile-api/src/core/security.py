@@ -4,30 +4,89 @@ Security utilities (password hashing).
 Why:
 - Passwords must NEVER be stored in plain text.
 - We store only a hashed version.
-- bcrypt is slow by design => makes brute forcing harder.
+- Argon2id is slow AND memory-hard by design => makes brute forcing
+  (even on GPUs) much harder.
 """
 
 import hashlib
+import secrets
 
-from passlib.context import CryptContext
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from passlib.hash import bcrypt_sha256
 
-# We configure bcrypt as our hashing algorithm
-pwd_context = CryptContext(schemes=["bcrypt_sha256"], deprecated="auto")
+from src.core.config import settings
 
+# Argon2id with OWASP's "19 MiB, t=2, p=1" profile:
+# rated equivalent to the 46 MiB/t=1 profile, but uses less memory per hash,
+# so more registrations/logins can run at once.
+# memory_cost is in KiB (19456 KiB = 19 MiB).
+PROD_HASH_PARAMS = {
+    "time_cost": 2,
+    "memory_cost": 19456,
+    "parallelism": 1,
+    "hash_len": 32,
+    "salt_len": 16,
+}
 
-def _normalize_password(password: str) -> str:
+# PASSWORD_HASH_TEST_MODE=1 only: the API tests check the logic *around*
+# hashing, not KDF strength, so they use the cheapest settings argon2 allows
+# (8 KiB, t=1). The name is deliberately specific: a generic flag like
+# TESTING is often set in CI/container images and would weaken production.
+# tests/test_security.py keeps PROD_HASH_PARAMS honest.
+TEST_HASH_PARAMS = {
+    **PROD_HASH_PARAMS,
+    "time_cost": 1,
+    "memory_cost": 8,
+}
+
+_hasher = PasswordHasher(
+    **(TEST_HASH_PARAMS if settings.PASSWORD_HASH_TEST_MODE else PROD_HASH_PARAMS)
+)
+
+# Hash of a random password nobody knows, checked when a login email doesn't exist.
+# Built at import, which also warms up the hasher (argon2 C library,
+# first memory allocation) before the first real request.
+_DUMMY_HASH = _hasher.hash(secrets.token_urlsafe(16))
+
+
+def _hash_shape(password_hash: str) -> tuple[str, int, int]:
     """
-    Normalize password input for hashing.
+    Split an Argon2 hash into (parameter prefix, salt length, digest length).
+
+    "$argon2id$v=19$m=19456,t=2,p=1$<salt>$<digest>" => ("$argon2id$v=19$m=19456,t=2,p=1", 22, 43)
+    """
+    prefix, salt, digest = password_hash.rsplit("$", 2)
+    return prefix, len(salt), len(digest)
+
+
+# Shape of a hash made with the current parameters (parsed once, here).
+# needs_rehash() compares against it instead of re-parsing parameters every login.
+_CURRENT_HASH_SHAPE = _hash_shape(_DUMMY_HASH)
+
+# Hashes created before the Argon2 switch (passlib's bcrypt_sha256)
+# look like "$bcrypt-sha256$v=2,t=2b,r=12$...".
+_LEGACY_PREFIX = "$bcrypt-sha256$"
+
+
+def _verify_legacy_bcrypt(password: str, password_hash: str) -> bool:
+    """
+    Verify an old passlib bcrypt_sha256 hash.
 
     Why:
-    - bcrypt has a hard 72-byte limit.
-    - If the password exceeds 72 bytes, we pre-hash with SHA-256.
+    - Users registered before the Argon2 switch must still be able to log in.
+    - passlib is kept for verifying these only; new hashes are always Argon2.
+    - Back then, passwords over 72 bytes were first replaced by their
+      SHA-256 hex digest, so we repeat that before verifying.
     """
     password_bytes = password.encode("utf-8")
     if len(password_bytes) > 72:
-        # Use hex so the normalized value is a str and <= 72 chars.
-        return hashlib.sha256(password_bytes).hexdigest()
-    return password
+        password = hashlib.sha256(password_bytes).hexdigest()
+    try:
+        return bcrypt_sha256.verify(password, password_hash)
+    except ValueError:
+        # Malformed hash
+        return False
 
 
 def hash_password(password: str) -> str:
@@ -37,8 +96,9 @@ def hash_password(password: str) -> str:
     Why:
     - DB stores hash, not the password.
     - If DB leaks, attacker still can't see real passwords easily.
+    - Argon2 has no input length limit, so no normalization is needed.
     """
-    return pwd_context.hash(_normalize_password(password))
+    return _hasher.hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -47,4 +107,38 @@ def verify_password(password: str, password_hash: str) -> bool:
 
     Used during login later.
     """
-    return pwd_context.verify(_normalize_password(password), password_hash)
+    if password_hash.startswith(_LEGACY_PREFIX):
+        return _verify_legacy_bcrypt(password, password_hash)
+
+    try:
+        return _hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def dummy_verify(password: str) -> None:
+    """
+    Run a full password check against a throwaway hash.
+
+    Why:
+    - Login for an unknown email would otherwise return instantly,
+      and that timing difference reveals which emails are registered.
+    - Result is ignored: the caller rejects the login either way.
+    """
+    verify_password(password, _DUMMY_HASH)
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """
+    Should this hash be replaced with a fresh one?
+
+    Why:
+    - True for legacy bcrypt hashes and Argon2 hashes made with old parameters.
+    - Login is the only time we see the plain password, so that's when we upgrade.
+    """
+    if password_hash.startswith(_LEGACY_PREFIX):
+        return True
+    # Fast path: nearly every stored hash already uses the current parameters.
+    if _hash_shape(password_hash) == _CURRENT_HASH_SHAPE:
+        return False
+    return _hasher.check_needs_rehash(password_hash)
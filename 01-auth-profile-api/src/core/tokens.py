@@ -6,11 +6,62 @@ Easy idea:
 - Client sends it in Authorization header for protected routes.
 """
 
-from datetime import datetime, timedelta, timezone
-from jose import jwt, JWTError
+import base64
+import hashlib
+import hmac
+import json
+import time
+from functools import lru_cache
+
+import jwt
+import orjson
+from jwt import InvalidTokenError
 
 from src.core.config import settings
 
+# Resolved once at import: settings don't change while the app runs.
+_ACCESS_TTL_SEC = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_JWT_SECRET = settings.JWT_SECRET
+_JWT_ALG = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALG]
+
+
+def _b64url(data: bytes) -> bytes:
+    """
+    base64url without "=" padding, as the JWT spec requires.
+
+    The padding length is known up front (len(data) % 3), so we slice it off
+    instead of scanning for "=" with rstrip().
+    """
+    encoded = base64.urlsafe_b64encode(data)
+    padding = -len(data) % 3
+    return encoded[: len(encoded) - padding]
+
+
+# HS256 fast path: the header never changes and the HMAC key is fixed,
+# so both are prepared once. Signing a token then only costs one orjson dump,
+# one copy() of the keyed HMAC, and the base64 encodes.
+_HS256_HEADER_B64 = _b64url(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+_HS256_HMAC = hmac.new(_JWT_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _encode_hs256(payload: dict) -> str:
+    """
+    Sign a JWT with HS256 using the prepared header + HMAC.
+
+    Produces the same bytes as jwt.encode(..., algorithm="HS256")
+    (locked down by tests/test_tokens.py).
+    """
+    payload_json = orjson.dumps(payload)
+    if not payload_json.isascii():
+        # orjson writes raw UTF-8, PyJWT (json.dumps) escapes it as \uXXXX.
+        # Rare (sub is a UUID), so just use PyJWT's serialization here.
+        payload_json = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    signing_input = _HS256_HEADER_B64 + b"." + _b64url(payload_json)
+    mac = _HS256_HMAC.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
 
 def create_access_token(user_id: str) -> str:
     """
@@ -18,20 +69,49 @@ def create_access_token(user_id: str) -> str:
 
     What we store inside:
     - sub (subject): user_id
-    - exp: expiry time
+    - exp: expiry time (int epoch seconds, so no datetime formatting)
 
     Why:
     - Server can verify token without storing sessions.
     - Expiry reduces damage if token is stolen.
     """
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-
+    # JWT exp is plain epoch seconds, so integer math is enough (no datetime objects).
     payload = {
         "sub": user_id,
-        "exp": expire,
+        "exp": int(time.time()) + _ACCESS_TTL_SEC,
     }
 
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    if _JWT_ALG == "HS256":
+        return _encode_hs256(payload)
+    return jwt.encode(payload, _JWT_SECRET, algorithm=_JWT_ALG)
+
+
+# Missing "exp" or "sub" makes jwt.decode raise InvalidTokenError.
+_DECODE_OPTIONS = {
+    "verify_signature": True,
+    "verify_exp": True,
+    "require": ["exp", "sub"],
+}
+
+
+@lru_cache(maxsize=4096)
+def _verify_token(token: str) -> tuple[str, int]:
+    """
+    Verify a token once and remember its (sub, exp).
+
+    Why:
+    - Signature check is CPU work, and clients resend the same token on every request.
+    - Invalid tokens raise InvalidTokenError, and lru_cache never caches exceptions.
+    - Expiry is re-checked by the caller on every hit, so cached entries age out naturally.
+    - Required claims are enforced inside the single verified decode (no second pass).
+    """
+    payload = jwt.decode(
+        token,
+        _JWT_SECRET,
+        algorithms=_JWT_ALGORITHMS,
+        options=_DECODE_OPTIONS,
+    )
+    return payload["sub"], int(payload["exp"])
 
 
 def decode_access_token(token: str) -> str | None:
@@ -45,11 +125,15 @@ def decode_access_token(token: str) -> str | None:
     Why:
     - Protected routes need to know which user is making the request.
     - JWT handles verification (signature + expiry) automatically.
+    - Repeat tokens skip verification via _verify_token's cache.
     """
+    now = int(time.time())
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-        user_id: str | None = payload.get("sub")
-        return user_id
-    except JWTError:
+        user_id, exp = _verify_token(token)
+    except InvalidTokenError:
         # Token is invalid, expired, or malformed
         return None
+
+    if exp <= now:
+        return None
+    return user_id
@@ -12,17 +12,44 @@ Later we will replace this with proper migrations (Alembic).
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 
 from src.core.config import settings
 from src.db.base import Base
 
+
+def _pool_options(database_url: str) -> dict:
+    """
+    Connection pool sizing for this database URL.
+
+    Why:
+    - Routes are sync `def`, so FastAPI runs them in its threadpool (40 threads).
+    - The default pool (5 + 10 overflow) is smaller than that and times out under load.
+    - Sizes are Settings fields, so each deployment can tune them via env.
+    - pool_use_lifo reuses the most recently returned connection, keeping a warm subset busy.
+    - These options only exist on QueuePool (PostgreSQL, file-based SQLite).
+      In-memory SQLite ("sqlite://") uses a different pool that rejects them.
+    """
+    url = make_url(database_url)
+    if not issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_use_lifo": True,
+    }
+
+
 # create_engine() sets up the DB connection pool
 # pool_pre_ping helps avoid stale connections in long-running servers.
-
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    **_pool_options(settings.DATABASE_URL),
 )
 
 # sessionmaker creates Session objects.
@@ -49,12 +76,16 @@ def get_db():
     Why:
     - Gives each request a DB session.
     - Ensures session is closed even if request fails.
+    - One transaction per request: repositories never commit, the whole
+      request commits once here (or rolls back if the route raised).
+    - FastAPI runs this exit code before the response is sent,
+      so the client never sees a success for data that wasn't saved.
     """
 
     db: Session = SessionLocal()
 
     try:
-        yield db
+        with db.begin():
+            yield db
     finally:
         db.close()
-
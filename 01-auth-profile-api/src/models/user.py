@@ -14,48 +14,11 @@ import uuid
 from datetime import datetime
 from sqlalchemy import String, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.types import TypeDecorator, CHAR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import Base
 
 
-class GUID(TypeDecorator):
-    """
-    Platform-independent GUID type.
-    
-    Why:
-    - PostgreSQL has native UUID support.
-    - SQLite doesn't, so we store as CHAR(36).
-    - This makes tests work with SQLite and production with PostgreSQL.
-    """
-    impl = CHAR
-    cache_ok = True
-
-    def load_dialect_impl(self, dialect):
-        if dialect.name == 'postgresql':
-            return dialect.type_descriptor(UUID(as_uuid=True))
-        else:
-            return dialect.type_descriptor(CHAR(36))
-
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return value
-        elif dialect.name == 'postgresql':
-            return value
-        else:
-            if isinstance(value, uuid.UUID):
-                return str(value)
-            return value
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return value
-        if isinstance(value, uuid.UUID):
-            return value
-        return uuid.UUID(value)
-
-
 class User(Base):
     """
     `__tablename__` is the actual table name in PostgreSQL.
@@ -65,9 +28,10 @@ class User(Base):
     # Primary Key:
     # - We use UUID so IDs are hard to guess (nice for security).
     # - default=uuid.uuid4 creates a new UUID automatically.
-    # - GUID type works with both PostgreSQL and SQLite.
+    # - Native UUID on PostgreSQL: the driver hands back uuid.UUID directly,
+    #   no per-row Python conversion. (On SQLite, SQLAlchemy stores it as a hex string.)
     id: Mapped[uuid.UUID] = mapped_column(
-        GUID(),
+        UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
     )
@@ -75,6 +39,9 @@ class User(Base):
     # Email:
     # - unique=True means DB will reject duplicates (best practice).
     # - index=True makes lookups faster (login checks email often).
+    # - Together they create ONE unique B-tree index, "ix_users_email".
+    #   Login's lookup uses it (no table scan), and register's
+    #   INSERT ... ON CONFLICT (email) needs it to detect duplicates.
     email: Mapped[str] = mapped_column(
         String(225),
         unique=True,
@@ -7,12 +7,48 @@ Why:
 """
 
 import uuid
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from functools import lru_cache
+
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 
 from src.models.user import User
 
 
+# Hot lookups are built once at import with bind parameters.
+# Each call only supplies the value (no per-call select() building),
+# and the compiled SQL is reused from SQLAlchemy's statement cache.
+_SELECT_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+# Authenticated requests only need public profile columns, so password_hash
+# is deferred (it still lazy-loads if something actually reads it).
+_PUBLIC_COLUMNS = load_only(
+    User.id, User.email, User.name, User.bio, User.created_at, User.updated_at
+)
+_SELECT_ID_BY_ID = select(User.id).where(User.id == bindparam("user_id"))
+
+# INSERT ... ON CONFLICT is dialect-specific SQL: PostgreSQL in production,
+# SQLite in tests. Both support ON CONFLICT DO NOTHING + RETURNING.
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> uuid.UUID:
+    """
+    Parse a user ID string from a token, remembering recent results.
+
+    Why:
+    - Every authenticated request passes the token's `sub` string here.
+    - The same few IDs repeat, so we skip re-parsing them.
+    """
+    return uuid.UUID(value)
+
+
 def get_user_by_email(db: Session, email: str) -> User | None:
     """
     Find a user by email.
@@ -21,27 +57,36 @@ def get_user_by_email(db: Session, email: str) -> User | None:
     - During register, we need to check if email already exists.
     - During login, we’ll also use this.
     """
-    stmt = select(User).where(User.email == email)
-    return db.execute(stmt).scalar_one_or_none()
+    return db.execute(_SELECT_BY_EMAIL, {"email": email}).scalar_one_or_none()
 
 
-def create_user(db: Session, *, email: str, password_hash: str, name: str) -> User:
+def create_user_if_absent(
+    db: Session, *, email: str, password_hash: str, name: str
+) -> User | None:
     """
-    Insert a new user.
+    Insert a new user unless the email is already taken.
+
+    Returns:
+    - the new User
+    - None if a user with this email already exists
 
     Why:
-    - DB insert should be done in one place.
-    - commit() saves changes.
-    - refresh() loads generated fields (id, timestamps) into the object.
+    - This is the only place users are inserted (register uses it).
+    - One statement instead of "SELECT by email, then INSERT" (one round-trip).
+    - RETURNING sends back generated fields (id, timestamps) in the same
+      round-trip, so there's no extra SELECT like refresh() would do.
+    - The request's transaction (get_db) commits it.
+    - No race: two concurrent registrations can't both pass the check,
+      the unique index on email decides.
     """
-    user = User(email=email, password_hash=password_hash, name=name)
-
-    db.add(user)
-    db.commit()
-    db.refresh(user)  # now user.id, created_at etc are available
-
-    return user
-
+    dialect_insert = _UPSERT_INSERTS[db.get_bind().dialect.name]
+    stmt = (
+        dialect_insert(User)
+        .values(email=email, password_hash=password_hash, name=name)
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
+    )
+    return db.execute(stmt).scalar_one_or_none()
 
 
 def get_user_by_id(db: Session, user_id: str | uuid.UUID) -> User | None:
@@ -50,23 +95,54 @@ def get_user_by_id(db: Session, user_id: str | uuid.UUID) -> User | None:
     
     Why:
     - Protected routes need to load the current user after verifying JWT.
-    - We get user_id from the token, then load full user details.
+    - We get user_id from the token, then load the public profile columns.
+    - Session.get() checks the identity map first, so repeat lookups
+      within the same request don't hit the DB again.
     """
     if isinstance(user_id, str):
-        user_id = uuid.UUID(user_id)
-    
-    stmt = select(User).where(User.id == user_id)
-    return db.execute(stmt).scalar_one_or_none()
+        user_id = _parse_uuid(user_id)
+
+    return db.get(User, user_id, options=[_PUBLIC_COLUMNS])
+
+
+def get_user_id(db: Session, user_id: str | uuid.UUID) -> uuid.UUID | None:
+    """
+    Check a user exists and return only their ID.
+
+    Why:
+    - Auth-only routes just need "who is this", not the whole row.
+    - Fetching one column avoids building a full User object.
+    """
+    if isinstance(user_id, str):
+        user_id = _parse_uuid(user_id)
+
+    return db.execute(_SELECT_ID_BY_ID, {"user_id": user_id}).scalar_one_or_none()
 
 
-def update_user(db: Session, user: User) -> User:
+def update_user(db: Session, user: User, changes: dict) -> User:
     """
     Update an existing user.
     
     Why:
-    - Centralize the commit + refresh logic.
-    - Service layer just modifies fields, then calls this.
+    - One `UPDATE users SET ... WHERE id = ...` with only the changed columns.
+    - RETURNING brings back the new updated_at in the same round-trip
+      (no refresh() SELECT afterwards).
+    - set_committed_value() mirrors the change on the in-memory user without
+      marking it dirty, so no second UPDATE is flushed later.
+    - The request's transaction (get_db) commits it.
+    - Callers drop the cached GET /me body
+      (profile_service.invalidate_profile_after_commit).
     """
-    db.commit()
-    db.refresh(user)
+    stmt = (
+        update(User)
+        .where(User.id == user.id)
+        .values(**changes)
+        .returning(User.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    updated_at = db.execute(stmt).scalar_one()
+
+    for field, value in changes.items():
+        set_committed_value(user, field, value)
+    set_committed_value(user, "updated_at", updated_at)
     return user
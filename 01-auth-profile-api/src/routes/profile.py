@@ -6,39 +6,46 @@ Why:
 - All these routes require authentication.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from src.db.session import get_db
-from src.core.deps import get_current_user
-from src.models.user import User
+from src.core.deps import CurrentUser, TokenUserId
 from src.schemas.user import UserPublic, UpdateProfileRequest, user_to_public
-from src.services.profile_service import update_profile
+from src.services.profile_service import get_profile_json, update_profile
 
 
 router = APIRouter(prefix="/me", tags=["profile"])
 
 
 @router.get("", response_model=UserPublic)
-def get_profile(user: User = Depends(get_current_user)):
+def get_profile(user_id: TokenUserId, db: Session = Depends(get_db)):
     """
     Get current user's profile.
     
     Why:
     - Frontend needs to display user info.
-    - get_current_user already loaded and verified the user.
+    - Profiles only change on PATCH, so the JSON is served from a short-lived
+      cache; the DB is only hit on a cache miss.
     
     Security:
     - Requires valid JWT token in Authorization header.
     - Returns only public fields (no password_hash).
     """
-    return user_to_public(user)
+    body = get_profile_json(db, user_id)
+    if body is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+    # Already-encoded JSON: returning a Response skips re-serialization.
+    return Response(content=body, media_type="application/json")
 
 
 @router.patch("", response_model=UserPublic)
 def update_profile_endpoint(
     payload: UpdateProfileRequest,
-    user: User = Depends(get_current_user),
+    user: CurrentUser,
     db: Session = Depends(get_db),
 ):
     """
@@ -10,7 +10,7 @@ Why:
 from uuid import UUID
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 def user_to_public(user) -> "UserPublic":
@@ -20,8 +20,10 @@ def user_to_public(user) -> "UserPublic":
     Why:
     - Avoids repeating the same mapping code everywhere.
     - One place to maintain if we add/remove fields.
+    - model_construct() skips validation: these values come straight from
+      our own DB row, and FastAPI checks the response model anyway.
     """
-    return UserPublic(
+    return UserPublic.model_construct(
         id=user.id,
         email=user.email,
         name=user.name,
@@ -110,6 +112,15 @@ class UpdateProfileRequest(BaseModel):
     Security:
     - We don't allow updating email, password, or id here.
     - Those require separate secure flows.
+
+    Config:
+    - str_strip_whitespace: "  Bob  " is stored as "Bob" (and "  A " fails min_length).
+      A whitespace-only bio becomes "" on purpose: bio has no min_length, and
+      "" is how a client clears it (null means "leave unchanged").
+    - frozen: the service only reads the payload, never mutates it.
+    - Both run inside pydantic-core, same as the Field() length checks.
     """
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     name: str | None = Field(None, min_length=2, max_length=120)
     bio: str | None = Field(None, max_length=500)
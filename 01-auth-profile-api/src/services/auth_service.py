@@ -6,11 +6,32 @@ Why:
 - Route/controller stays thin and readable.
 """
 
+import hashlib
+import hmac
+import secrets
+import threading
+
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
-from src.core.security import hash_password, verify_password
+from src.core.security import dummy_verify, hash_password, needs_rehash, verify_password
 from src.core.tokens import create_access_token
-from src.repositories.user_repo import get_user_by_email, create_user
+from src.models.user import User
+from src.repositories.user_repo import get_user_by_email, create_user_if_absent, update_user
+from src.schemas.user import LoginResponse, RegisterResponse, user_to_public
+from src.services.profile_service import invalidate_profile_after_commit
+
+
+# Recently verified logins, so repeat logins skip the slow password hash.
+# Why:
+# - Keys are HMACs under a random per-process key: no plain passwords in memory,
+#   and nothing usable if the cache is dumped.
+# - The stored hash is part of the key, so a password change (or rehash)
+#   automatically stops matching old entries.
+# - Short ttl: a hit only means "this exact password matched within the last minute".
+_VERIFIED_LOGIN_KEY = secrets.token_bytes(32)
+_verified_logins: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_verified_logins_lock = threading.Lock()
 
 
 class EmailAlreadyExists(Exception):
@@ -30,50 +51,81 @@ class InvalidCredentials(Exception):
     pass
 
 
-def register_user(db: Session, *, email: str, password: str, name: str):
+def _verify_password_cached(user: User, password: str) -> bool:
+    """
+    verify_password, but remembers successful checks for a short time.
+
+    Only successes are cached: wrong passwords always pay the full hash cost.
+    """
+    cache_key = hmac.new(
+        _VERIFIED_LOGIN_KEY,
+        f"{user.id}:{user.password_hash}:{password}".encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+
+    with _verified_logins_lock:
+        if cache_key in _verified_logins:
+            return True
+
+    if not verify_password(password, user.password_hash):
+        return False
+
+    with _verified_logins_lock:
+        _verified_logins[cache_key] = True
+    return True
+
+
+def register_user(db: Session, *, email: str, password: str, name: str) -> RegisterResponse:
     """
     Register a new user.
 
     Flow:
-    1) Check if email exists
-    2) Hash password
-    3) Create user in DB
-    4) Create access token
-    5) Return (token, user)
+    1) Hash password
+    2) Create user in DB, unless the email is taken (single INSERT ... ON CONFLICT)
+    3) Create access token
+    4) Return the finished RegisterResponse (route returns it as-is)
     """
-    existing = get_user_by_email(db, email)
-    if existing:
-        raise EmailAlreadyExists()
-
     password_hash = hash_password(password)
-    user = create_user(db, email=email, password_hash=password_hash, name=name)
+    user = create_user_if_absent(db, email=email, password_hash=password_hash, name=name)
+    if user is None:
+        raise EmailAlreadyExists()
 
     token = create_access_token(str(user.id))
 
-    return token, user
+    return RegisterResponse.model_construct(access_token=token, user=user_to_public(user))
 
 
-def login_user(db: Session, *, email: str, password: str):
+def login_user(db: Session, *, email: str, password: str) -> LoginResponse:
     """
     Login an existing user.
     
     Flow:
     1) Find user by email
     2) Verify password against stored hash
-    3) Create access token
-    4) Return (token, user)
+    3) Upgrade the stored hash if it uses an old algorithm/parameters
+       (and drop the cached GET /me, since updated_at changes)
+    4) Create access token
+    5) Return the finished LoginResponse (route returns it as-is)
     
     Security:
     - We don't tell which is wrong (email vs password) to avoid user enumeration.
     - Just say "invalid credentials".
+    - Unknown emails still pay for a password check (dummy_verify),
+      so response time doesn't reveal whether the email exists.
     """
     user = get_user_by_email(db, email)
     if not user:
+        dummy_verify(password)
         raise InvalidCredentials()
     
-    if not verify_password(password, user.password_hash):
+    if not _verify_password_cached(user, password):
         raise InvalidCredentials()
+
+    if needs_rehash(user.password_hash):
+        update_user(db, user, {"password_hash": hash_password(password)})
+        # updated_at changed => cached GET /me is stale
+        invalidate_profile_after_commit(db, str(user.id))
     
     token = create_access_token(str(user.id))
     
-    return token, user
+    return LoginResponse.model_construct(access_token=token, user=user_to_public(user))
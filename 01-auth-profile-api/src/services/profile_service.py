@@ -6,11 +6,102 @@ Why:
 - Easy to test and maintain.
 """
 
+import threading
+
+from cachetools import TTLCache
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from src.models.user import User
-from src.repositories.user_repo import update_user
-from src.schemas.user import UpdateProfileRequest
+from src.repositories.user_repo import get_user_by_id, update_user
+from src.schemas.user import UpdateProfileRequest, user_to_public
+
+
+# In-process cache of rendered GET /me bodies, keyed by user_id (str).
+# Why:
+# - Every users UPDATE (PATCH /me, password rehash on login) invalidates the entry
+#   via invalidate_profile_after_commit().
+# - ttl bounds staleness when several worker processes each keep their own cache.
+# - TTLCache isn't thread-safe, and sync routes run in a threadpool => lock.
+_profile_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_profile_cache_lock = threading.Lock()
+
+# Per-user invalidation counter (guarded by _profile_cache_lock).
+# A GET /me that missed the cache only stores its body if no invalidation
+# happened while it was reading the DB; otherwise it may hold the old row.
+# One small int per user whose profile changed in this process.
+_profile_generations: dict[str, int] = {}
+
+# db.info key holding user_ids whose cached profile must go once the
+# session's transaction commits.
+_PENDING_INVALIDATIONS = "profile_invalidations"
+
+
+def get_profile_json(db: Session, user_id: str) -> bytes | None:
+    """
+    Return the user's public profile as JSON bytes.
+
+    Flow:
+    1. Cache hit => return stored bytes (no DB, no serialization)
+    2. Miss => load user, render UserPublic JSON
+    3. Store it, unless the profile was invalidated meanwhile
+       (a PATCH committed after our read => our body may be the old row)
+    4. User doesn't exist => None
+    """
+    with _profile_cache_lock:
+        body = _profile_cache.get(user_id)
+        generation = _profile_generations.get(user_id, 0)
+    if body is not None:
+        return body
+
+    user = get_user_by_id(db, user_id)
+    if user is None:
+        return None
+
+    body = user_to_public(user).model_dump_json().encode()
+    with _profile_cache_lock:
+        if _profile_generations.get(user_id, 0) == generation:
+            _profile_cache[user_id] = body
+    return body
+
+
+def invalidate_profile(user_id: str) -> None:
+    """
+    Drop a cached profile so the next GET /me reloads it.
+
+    Also bumps the user's generation, so a GET /me that is still reading
+    the old row won't put it back into the cache.
+    """
+    with _profile_cache_lock:
+        _profile_cache.pop(user_id, None)
+        _profile_generations[user_id] = _profile_generations.get(user_id, 0) + 1
+
+
+def invalidate_profile_after_commit(db: Session, user_id: str) -> None:
+    """
+    Drop a cached profile once the current transaction commits.
+
+    Call it after every update_user(): any change (even just updated_at)
+    makes the cached GET /me body stale.
+
+    Why:
+    - get_db commits after the route returns. Invalidating right away leaves
+      a window where a concurrent GET /me misses, reads the old committed row
+      and caches it again for the full ttl (the PATCH looks lost).
+    """
+    db.info.setdefault(_PENDING_INVALIDATIONS, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_profile_invalidations(db: Session) -> None:
+    for user_id in db.info.pop(_PENDING_INVALIDATIONS, ()):
+        invalidate_profile(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_profile_invalidations(db: Session) -> None:
+    # Nothing was written, so the cached profiles are still correct.
+    db.info.pop(_PENDING_INVALIDATIONS, None)
 
 
 def update_profile(db: Session, *, user: User, updates: UpdateProfileRequest) -> User:
@@ -19,20 +110,25 @@ def update_profile(db: Session, *, user: User, updates: UpdateProfileRequest) ->
     
     Flow:
     1. Check which fields are provided (not None)
-    2. Update only those fields
-    3. Save to DB
-    4. Return updated user
+    2. Nothing provided => return user as-is (no DB write at all)
+    3. Update only those fields (single UPDATE)
+    4. Drop the cached GET /me response (after the transaction commits)
+    5. Return updated user
     
     Security:
     - Only allows updating safe fields (name, bio)
     - Ignores attempts to update protected fields (handled by schema)
     """
     # Only update fields that are actually provided
-    if updates.name is not None:
-        user.name = updates.name
-    
-    if updates.bio is not None:
-        user.bio = updates.bio
+    changes = {
+        field: value
+        for field, value in (("name", updates.name), ("bio", updates.bio))
+        if value is not None
+    }
+    if not changes:
+        return user
     
     # Save changes
-    return update_user(db, user)
+    user = update_user(db, user, changes)
+    invalidate_profile_after_commit(db, str(user.id))
+    return user
@@ -6,68 +6,129 @@ Why:
 - Runs once before tests, keeps tests clean.
 """
 
+import os
+
+# Must be set before importing the app (settings are read at import time).
+# Switches password hashing to cheap test parameters.
+os.environ["PASSWORD_HASH_TEST_MODE"] = "1"
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.main import app
 from src.db.base import Base
-from src.db.session import get_db
+from src.db import session as session_module
 
 
-# Use in-memory SQLite for tests (fast, isolated)
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Use in-memory SQLite for tests (fast, isolated, no disk I/O)
+# With pytest-xdist every worker is its own process => its own private DB.
+SQLALCHEMY_DATABASE_URL = "sqlite://"
 
+# StaticPool = one shared connection, so every session sees the same in-memory DB
+# (each new connection to "sqlite://" would otherwise get its own empty DB).
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # needed for SQLite
+    connect_args={"check_same_thread": False},  # needed for SQLite
+    poolclass=StaticPool,
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+# pysqlite's own transaction handling breaks SAVEPOINTs.
+# Let SQLAlchemy emit BEGIN itself (documented SQLAlchemy recipe for SQLite).
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# join_transaction_mode="create_savepoint":
+# session.commit() inside the app only releases a SAVEPOINT,
+# the outer transaction (owned by the fixture) is never committed.
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    join_transaction_mode="create_savepoint",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables():
+    """
+    Create tables once for the whole test run.
+
+    Why:
+    - Schema DDL is the slowest part of these tiny tests.
+    - Each test rolls back its own data instead (see `db`).
+    """
+    Base.metadata.create_all(bind=engine)
 
 
 @pytest.fixture(scope="function")
 def db():
     """
-    Create a fresh database for each test.
+    Give each test a session inside a transaction that is rolled back.
     
     Why:
     - Tests are isolated (one test doesn't affect another).
-    - Clean slate every time.
+    - Clean slate every time, without dropping/creating tables.
     """
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-    
-    # Create session
-    db = TestingSessionLocal()
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection)
     
     try:
         yield db
     finally:
         db.close()
-        # Drop tables after test
-        Base.metadata.drop_all(bind=engine)
+        # Undo everything the test wrote
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """
+    One TestClient for the whole test run.
+
+    Why:
+    - Tests only need a different DB session, which `client` swaps in.
+    - Not used as a context manager, so app startup (init_db against the real
+      DATABASE_URL) never runs; `create_tables` sets up the test DB instead.
+      That also keeps parallel runs (`pytest -n auto`) from racing on it.
+    """
+    test_client = TestClient(app)
+    yield test_client
+    test_client.close()
 
 
 @pytest.fixture(scope="function")
-def client(db):
+def client(db, app_client, monkeypatch):
     """
-    FastAPI test client with overridden DB dependency.
+    FastAPI test client that talks to the test DB.
     
     Why:
     - Uses test DB instead of production DB.
     - Makes real HTTP requests to the app (without network).
+    - Only the session factory is swapped, so the real get_db runs:
+      a session per request, one transaction that commits when the route
+      returns. Writes are only kept if that commit happens (closing the
+      session drops anything uncommitted), same as in production.
     """
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
-    with TestClient(app) as test_client:
-        yield test_client
-    
-    app.dependency_overrides.clear()
+    # Bound to the test's connection, so the request's commit only releases
+    # a SAVEPOINT and `db` still rolls everything back afterwards.
+    connection = db.get_bind()
+
+    def request_session():
+        return TestingSessionLocal(bind=connection)
+
+    monkeypatch.setattr(session_module, "SessionLocal", request_session)
+
+    yield app_client
@@ -2,11 +2,14 @@
 Tests for auth endpoints (register, login).
 
 Coverage:
-- POST /auth/register (success, duplicate email, validation errors)
-- POST /auth/login (success, wrong email, wrong password)
+- POST /auth/register (success, duplicate email, validation errors, committed)
+- POST /auth/login (success, wrong email, wrong password, legacy hash upgrade)
 """
 
 import pytest
+from passlib.hash import bcrypt_sha256
+
+from src.repositories.user_repo import get_user_by_email, update_user
 
 
 def test_register_success(client):
@@ -47,6 +50,32 @@ def test_register_success(client):
     assert "password_hash" not in user
 
 
+def test_register_is_committed(client, db):
+    """
+    Test a registration is still there after the request ends.
+    
+    Why:
+    - Repositories never commit; get_db commits once per request.
+    - The request's session is closed afterwards, which would drop
+      the new user if that commit didn't happen.
+    - `db` is a different session, so it only sees committed data.
+    """
+    response = client.post(
+        "/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "test1234",
+            "name": "Test User",
+        },
+    )
+    
+    assert response.status_code == 201
+    
+    user = get_user_by_email(db, "test@example.com")
+    assert user is not None
+    assert str(user.id) == response.json()["user"]["id"]
+
+
 def test_register_duplicate_email(client):
     """
     Test registration with already registered email.
@@ -205,3 +234,82 @@ def test_login_wrong_password(client):
     
     assert response.status_code == 401
     assert "invalid" in response.json()["detail"].lower()
+
+
+def test_login_repeated(client):
+    """
+    Test logging in several times in a row.
+    
+    Why:
+    - Repeat logins are served from a short-lived verification cache.
+    - The cache must never let a wrong password through.
+    """
+    # Register
+    client.post(
+        "/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "test1234",
+            "name": "Test User",
+        },
+    )
+    
+    credentials = {"email": "test@example.com", "password": "test1234"}
+    assert client.post("/auth/login", json=credentials).status_code == 200
+    assert client.post("/auth/login", json=credentials).status_code == 200
+    
+    # Wrong password after a cached success
+    response = client.post(
+        "/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "wrongpassword",
+        },
+    )
+    
+    assert response.status_code == 401
+
+
+def test_login_rehash_invalidates_profile_cache(client, db):
+    """
+    Test a login that upgrades a legacy hash also drops the cached GET /me.
+    
+    Why:
+    - The rehash UPDATE changes updated_at, so the cached body is stale.
+    
+    Flow:
+    1. Register, fill the GET /me cache
+    2. Behind the cache's back: store a legacy hash and a new name
+    3. Login => hash upgraded to Argon2
+    4. GET /me shows the new name (cache was dropped)
+    """
+    # Register
+    register_response = client.post(
+        "/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "test1234",
+            "name": "Old Name",
+        },
+    )
+    headers = {"Authorization": f"Bearer {register_response.json()['access_token']}"}
+    
+    # Fill the cache
+    assert client.get("/me", headers=headers).json()["name"] == "Old Name"
+    
+    # Direct DB write (no cache invalidation)
+    user = get_user_by_email(db, "test@example.com")
+    legacy_hash = bcrypt_sha256.using(rounds=4).hash("test1234")
+    update_user(db, user, {"password_hash": legacy_hash, "name": "New Name"})
+    db.commit()
+    
+    response = client.post(
+        "/auth/login",
+        json={"email": "test@example.com", "password": "test1234"},
+    )
+    assert response.status_code == 200
+    
+    db.expire_all()
+    user = get_user_by_email(db, "test@example.com")
+    assert user.password_hash.startswith("$argon2id$")
+    assert client.get("/me", headers=headers).json()["name"] == "New Name"
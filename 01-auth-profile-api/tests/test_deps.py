@@ -0,0 +1,100 @@
+"""
+Tests for auth dependencies (src/core/deps.py).
+
+Coverage:
+- CurrentUserId (valid token, unknown user, invalid token)
+
+No route uses CurrentUserId yet, so these tests mount it on a tiny app
+that shares the test DB setup with `client`.
+"""
+
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.deps import CurrentUserId
+from src.core.tokens import create_access_token
+
+
+deps_app = FastAPI()
+
+
+@deps_app.get("/whoami")
+def whoami(user_id: CurrentUserId):
+    return {"id": str(user_id)}
+
+
+@pytest.fixture
+def deps_client(client):
+    """
+    TestClient for `deps_app`.
+
+    Why:
+    - `client` already points get_db at the test DB, for any app.
+    - `client` is also used to register users.
+    """
+    return TestClient(deps_app)
+
+
+def test_current_user_id_success(client, deps_client):
+    """
+    Test CurrentUserId with a valid token for an existing user.
+
+    Expected:
+    - Returns that user's ID
+    """
+    register_response = client.post(
+        "/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "test1234",
+            "name": "Test User",
+        },
+    )
+    data = register_response.json()
+
+    response = deps_client.get(
+        "/whoami",
+        headers={"Authorization": f"Bearer {data['access_token']}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == data["user"]["id"]
+
+
+def test_current_user_id_unknown_user(deps_client):
+    """
+    Test CurrentUserId with a valid token whose user doesn't exist.
+
+    Why:
+    - The token alone isn't enough: the user may have been deleted.
+
+    Expected:
+    - 401 Unauthorized
+    """
+    token = create_access_token(str(uuid.uuid4()))
+
+    response = deps_client.get(
+        "/whoami",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "User not found"
+
+
+def test_current_user_id_invalid_token(deps_client):
+    """
+    Test CurrentUserId with a token that doesn't verify.
+
+    Expected:
+    - 401 Unauthorized
+    """
+    response = deps_client.get(
+        "/whoami",
+        headers={"Authorization": "Bearer invalid_token_here"},
+    )
+
+    assert response.status_code == 401
@@ -4,9 +4,18 @@ Tests for profile endpoints (GET /me, PATCH /me).
 Coverage:
 - GET /me (success, missing token, invalid token)
 - PATCH /me (update name, update bio, update both, no auth)
+- Cached GET /me is dropped only once the PATCH commits
+- A GET /me that read the old row doesn't cache it after a PATCH commits
+- PATCH /me strips surrounding whitespace (name, bio)
 """
 
 import pytest
+from sqlalchemy.orm import Session
+
+from src.repositories.user_repo import create_user_if_absent, get_user_by_id
+from src.schemas.user import UpdateProfileRequest
+from src.services import profile_service
+from src.services.profile_service import get_profile_json, update_profile
 
 
 def test_get_profile_success(client):
@@ -166,6 +175,110 @@ def test_update_profile_both_fields(client):
     assert user["bio"] == "New bio"
 
 
+def test_get_profile_after_update(client):
+    """
+    Test GET /me returns fresh data after PATCH /me.
+    
+    Why:
+    - GET /me is cached; PATCH must invalidate the cached response.
+    """
+    # Register
+    register_response = client.post(
+        "/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "test1234",
+            "name": "Old Name",
+        },
+    )
+    token = register_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    # Fill the cache
+    assert client.get("/me", headers=headers).json()["name"] == "Old Name"
+    
+    # Update name
+    client.patch("/me", headers=headers, json={"name": "New Name"})
+    
+    response = client.get("/me", headers=headers)
+    
+    assert response.status_code == 200
+    assert response.json()["name"] == "New Name"
+
+
+def test_profile_cache_dropped_after_commit(db):
+    """
+    Test the cached GET /me body is dropped when the update commits, not before.
+    
+    Why:
+    - get_db commits after the route returns.
+    - Dropping the cache earlier lets a concurrent GET /me re-cache the
+      old committed row, and the PATCH would look lost for the cache ttl.
+    """
+    user = create_user_if_absent(
+        db, email="test@example.com", password_hash="x", name="Old Name"
+    )
+    db.commit()
+    user_id = str(user.id)
+    
+    # Fill the cache
+    assert b"Old Name" in get_profile_json(db, user_id)
+    
+    update_profile(db, user=user, updates=UpdateProfileRequest(name="New Name"))
+    
+    # Not committed yet => cache still holds the committed profile
+    assert b"Old Name" in get_profile_json(db, user_id)
+    
+    db.commit()
+    
+    assert b"New Name" in get_profile_json(db, user_id)
+
+
+def test_profile_cache_skips_store_after_concurrent_update(db, monkeypatch):
+    """
+    Test a GET /me that read the old row doesn't cache it.
+    
+    Order:
+    1. GET /me misses the cache and reads the old row
+    2. A PATCH (another request/session) commits and invalidates
+    3. The GET finishes and would store the old profile
+    
+    Expected:
+    - Step 3 doesn't store, so the next GET /me sees the new name
+    """
+    user = create_user_if_absent(
+        db, email="test@example.com", password_hash="x", name="Old Name"
+    )
+    db.commit()
+    user_id = str(user.id)
+    connection = db.get_bind()
+    
+    def read_then_concurrent_patch(read_db, read_user_id):
+        old_user = get_user_by_id(read_db, read_user_id)
+        
+        patch_db = Session(bind=connection, join_transaction_mode="create_savepoint")
+        patch_user = get_user_by_id(patch_db, read_user_id)
+        update_profile(
+            patch_db, user=patch_user, updates=UpdateProfileRequest(name="New Name")
+        )
+        patch_db.commit()
+        patch_db.close()
+        
+        return old_user
+    
+    monkeypatch.setattr(profile_service, "get_user_by_id", read_then_concurrent_patch)
+    
+    # This GET rendered the old row, but must not have cached it
+    assert b"Old Name" in get_profile_json(db, user_id)
+    
+    monkeypatch.undo()
+    fresh_db = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        assert b"New Name" in get_profile_json(fresh_db, user_id)
+    finally:
+        fresh_db.close()
+
+
 def test_update_profile_no_auth(client):
     """
     Test PATCH /me without authentication.
@@ -241,3 +354,67 @@ def test_update_profile_validation_error(client):
     )
     
     assert response.status_code == 422
+
+
+def test_update_profile_strips_whitespace(client):
+    """
+    Test PATCH /me trims surrounding whitespace before validating.
+    
+    Expected:
+    - "  New Name  " is stored as "New Name"
+    - A whitespace-only bio is stored as "" (clears the bio)
+    """
+    # Register
+    register_response = client.post(
+        "/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "test1234",
+            "name": "Test User",
+        },
+    )
+    token = register_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    response = client.patch(
+        "/me",
+        headers=headers,
+        json={"name": "  New Name  ", "bio": "   "},
+    )
+    
+    assert response.status_code == 200
+    user = response.json()
+    assert user["name"] == "New Name"
+    assert user["bio"] == ""
+    
+    # Stored values, not just the PATCH response
+    user = client.get("/me", headers=headers).json()
+    assert user["name"] == "New Name"
+    assert user["bio"] == ""
+
+
+def test_update_profile_name_too_short_after_strip(client):
+    """
+    Test PATCH /me with a name that is only long enough with its padding.
+    
+    Expected:
+    - 422 ("  A " is "A" after stripping, < 2 chars)
+    """
+    # Register
+    register_response = client.post(
+        "/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "test1234",
+            "name": "Test User",
+        },
+    )
+    token = register_response.json()["access_token"]
+    
+    response = client.patch(
+        "/me",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"name": "  A "},
+    )
+    
+    assert response.status_code == 422
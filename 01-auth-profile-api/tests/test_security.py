@@ -0,0 +1,78 @@
+"""
+Tests for password hashing (src/core/security.py).
+
+Coverage:
+- Production Argon2 parameters meet the OWASP minimum
+- hash/verify round trip
+- Legacy passlib bcrypt_sha256 hashes still verify and get flagged for rehash
+"""
+
+import hashlib
+
+from passlib.hash import bcrypt_sha256
+
+from src.core.security import (
+    PROD_HASH_PARAMS,
+    hash_password,
+    needs_rehash,
+    verify_password,
+)
+
+
+def test_prod_hash_params_meet_owasp_minimum():
+    """
+    Production KDF strength.
+    
+    Why:
+    - The test suite hashes with cheap parameters (PASSWORD_HASH_TEST_MODE=1),
+      so this is what guards the real ones.
+    - OWASP minimum for Argon2id: m=19 MiB, t=2, p=1.
+    """
+    assert PROD_HASH_PARAMS["memory_cost"] >= 19456
+    assert PROD_HASH_PARAMS["time_cost"] >= 2
+    assert PROD_HASH_PARAMS["parallelism"] >= 1
+    assert PROD_HASH_PARAMS["salt_len"] >= 16
+
+
+def test_hash_and_verify_password():
+    """
+    Test a hashed password verifies, and a wrong one doesn't.
+    """
+    password_hash = hash_password("test1234")
+    
+    assert password_hash.startswith("$argon2id$")
+    assert verify_password("test1234", password_hash)
+    assert not verify_password("wrongpassword", password_hash)
+    assert not needs_rehash(password_hash)
+
+
+def test_legacy_bcrypt_hash():
+    """
+    Test hashes stored by the original passlib setup ("$bcrypt-sha256$...").
+
+    Expected:
+    - Still verify (users can log in)
+    - Flagged for rehash (upgraded to Argon2 on that login)
+    """
+    legacy_hash = bcrypt_sha256.using(rounds=4).hash("test1234")
+
+    assert legacy_hash.startswith("$bcrypt-sha256$v=2,")
+    assert verify_password("test1234", legacy_hash)
+    assert not verify_password("wrongpassword", legacy_hash)
+    assert needs_rehash(legacy_hash)
+
+
+def test_legacy_bcrypt_long_password():
+    """
+    Test a >72-byte password from the passlib era.
+
+    Why:
+    - Those were stored as the hash of their SHA-256 hex digest.
+    """
+    password = "p" * 100
+    legacy_hash = bcrypt_sha256.using(rounds=4).hash(
+        hashlib.sha256(password.encode("utf-8")).hexdigest()
+    )
+
+    assert verify_password(password, legacy_hash)
+    assert not verify_password("p" * 99, legacy_hash)
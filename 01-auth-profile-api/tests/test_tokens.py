@@ -0,0 +1,102 @@
+"""
+Tests for JWT helpers (src/core/tokens.py).
+
+Coverage:
+- HS256 fast path matches PyJWT byte for byte
+- base64url padding removal
+- Cached tokens are still rejected once expired
+- Tokens without "sub" are rejected
+"""
+
+import base64
+import time
+
+import jwt
+import pytest
+
+from src.core import tokens
+from src.core.tokens import (
+    _JWT_SECRET,
+    _b64url,
+    _encode_hs256,
+    create_access_token,
+    decode_access_token,
+)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"sub": "5b0c1c9e-2f5a-4b8e-9a57-3f1f6d1e8a42", "exp": 4_000_000_000},
+        {"sub": "x", "exp": 4_102_444_800},
+        {"sub": "ünïcødé ✓", "exp": 9_999_999_999},
+    ],
+)
+def test_encode_hs256_matches_pyjwt(payload):
+    """
+    Test the hand-rolled HS256 encoder against PyJWT.
+
+    Why:
+    - create_access_token skips jwt.encode for HS256, so nothing else
+      guarantees the header, payload JSON, and signature are right.
+    """
+    token = _encode_hs256(payload)
+
+    assert token == jwt.encode(payload, _JWT_SECRET, algorithm="HS256")
+    assert jwt.decode(token, _JWT_SECRET, algorithms=["HS256"]) == payload
+
+
+def test_create_access_token_decodes():
+    """
+    Test a real access token is accepted by PyJWT.
+    """
+    token = create_access_token("some-user-id")
+
+    payload = jwt.decode(token, _JWT_SECRET, algorithms=["HS256"])
+    assert payload["sub"] == "some-user-id"
+
+
+@pytest.mark.parametrize("length", range(6))
+def test_b64url_strips_padding(length):
+    """
+    Test the computed padding slice for every remainder (len % 3).
+
+    Expected:
+    - Same as base64url + rstrip("="), which is what the JWT spec asks for
+    """
+    data = bytes(range(length))
+
+    assert _b64url(data) == base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def test_cached_token_rejected_after_expiry(monkeypatch):
+    """
+    Test a token already in the verification cache stops working at exp.
+    
+    Why:
+    - _verify_token caches (sub, exp) and never re-checks the signature,
+      so decode_access_token's own exp check is the only thing left.
+    """
+    token = create_access_token("some-user-id")
+    
+    # First decode verifies and caches
+    assert decode_access_token(token) == "some-user-id"
+    
+    exp = jwt.decode(token, _JWT_SECRET, algorithms=["HS256"])["exp"]
+    monkeypatch.setattr(tokens.time, "time", lambda: exp)
+    
+    assert decode_access_token(token) is None
+
+
+def test_token_without_sub_rejected():
+    """
+    Test a correctly signed token with no "sub" claim.
+    
+    Expected:
+    - None (the decode options require "sub")
+    """
+    token = jwt.encode(
+        {"exp": int(time.time()) + 60}, _JWT_SECRET, algorithm="HS256"
+    )
+    
+    assert decode_access_token(token) is None